@@ -3,114 +3,182 @@
 Parse TMA performance data and create plots with average times and error bars.
 """
 
-import re
+import argparse
+import functools
+import glob
+import io
+import math
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
 import numpy as np
-import matplotlib.pyplot as plt
-from collections import defaultdict
+
+# Color mapping for different test types
+COLOR_MAP = {
+    'TMA No Swizzling': 'blue',
+    'TMA Multicast': 'red',
+    'TMA No Multicast': 'green'
+}
+
+@dataclass
+class ParsedLog:
+    """Test cases stored column-wise; case i's trials are times_flat[offsets[i]:offsets[i + 1]]."""
+    names: list
+    deep_copies: list
+    multicasts: list
+    times_flat: np.ndarray
+    offsets: np.ndarray
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def labels(self):
+        """Plot/summary label of every test case."""
+        return [f"{name} ({deep_copy})" for name, deep_copy in zip(self.names, self.deep_copies)]
+    
+    @classmethod
+    def from_cases(cls, names, deep_copies, multicasts, times_per_case):
+        """Build a log from per-case columns and one array of trial times per case."""
+        offsets = np.zeros(len(times_per_case) + 1, dtype=np.int32)
+        np.cumsum([len(times) for times in times_per_case], out=offsets[1:])
+        return cls(names=names,
+                   deep_copies=deep_copies,
+                   multicasts=multicasts,
+                   times_flat=np.concatenate(times_per_case or [np.empty(0)]),
+                   offsets=offsets)
+    
+    def case_times(self, i):
+        """Trial times of case i, as a view into times_flat."""
+        return self.times_flat[self.offsets[i]:self.offsets[i + 1]]
+    
+    def select(self, indices):
+        """Return a new log holding only the given cases, in the given order."""
+        indices = list(indices)
+        return self.from_cases(names=[self.names[i] for i in indices],
+                               deep_copies=[self.deep_copies[i] for i in indices],
+                               multicasts=[self.multicasts[i] for i in indices],
+                               times_per_case=[self.case_times(i) for i in indices])
+    
+    def sorted(self):
+        """Return the log ordered by name and deep copy factor."""
+        return self.select(sorted(range(len(self)),
+                                  key=lambda i: (self.names[i], self.deep_copies[i])))
 
 def parse_performance_data(filename):
     """Parse the performance data from the output file."""
-    test_cases = []
+    names = []
+    deep_copies = []
+    multicasts = []
+    starts = []
+    times = array('d')
     current_case = None
+    # "Deep copy NX." may be printed just before or just after its header
+    pending_deep_copy = None
+    
+    with open(filename, 'r', buffering=1 << 20) as f:
+        content = f.read()
     
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            
-            # Check for test case headers
-            if "Copy with TMA load and store -- no swizzling" in line:
-                current_case = {
-                    'name': 'TMA No Swizzling',
-                    'multicast': False,
-                    'deep_copy': '1X',
-                    'times': []
-                }
-            elif "Copy with TMA Multicast load and store" in line:
-                current_case = {
-                    'name': 'TMA Multicast',
-                    'multicast': True,
-                    'deep_copy': None,  # Will be set by next line
-                    'times': []
-                }
-            elif "Copy with TMA load and store, NO multicast" in line:
-                current_case = {
-                    'name': 'TMA No Multicast',
-                    'multicast': False,
-                    'deep_copy': None,  # Will be set by next line
-                    'times': []
-                }
-            elif "Deep copy 2X" in line and current_case:
-                current_case['deep_copy'] = '2X'
-            elif "Deep copy 4X" in line and current_case:
-                current_case['deep_copy'] = '4X'
-            elif current_case and line.startswith("Trial") and "Completed in" in line:
-                # Extract time from trial line
-                match = re.search(r'Completed in ([\d.]+)ms', line)
-                if match:
-                    time_ms = float(match.group(1))
-                    current_case['times'].append(time_ms)
-            elif line.startswith("Success") and current_case and current_case['times']:
-                # End of current test case
-                test_cases.append(current_case.copy())
+    # Single pass over the lines, tracking the index of the test case currently open.
+    # Cases are contiguous in the log, so all trials go into one flat buffer.
+    for line in content.splitlines():
+        if "Completed in" in line:
+            if current_case is None:
+                continue
+            # Skip truncated or malformed trial lines, e.g. from a benchmark killed mid-run
+            _, found, tail = line.partition('Completed in ')
+            value, unit, _ = tail.partition('ms')
+            if not (found and unit):
+                continue
+            try:
+                time_ms = float(value)
+            except ValueError:
+                continue
+            if math.isfinite(time_ms):
+                times.append(time_ms)
+        elif "Copy with" in line:
+            # This is a new test case header
+            if "no swizzling" in line:
+                name, multicast, deep_copy = 'TMA No Swizzling', False, '1X'  # Baseline case
+            elif "NO multicast" in line:
+                name, multicast, deep_copy = 'TMA No Multicast', False, pending_deep_copy
+            elif "Multicast" in line:
+                name, multicast, deep_copy = 'TMA Multicast', True, pending_deep_copy
+            else:
                 current_case = None
+                continue
+            current_case = len(names)
+            names.append(name)
+            multicasts.append(multicast)
+            deep_copies.append(deep_copy)
+            starts.append(len(times))
+            pending_deep_copy = None
+        elif "Deep copy 2X" in line or "Deep copy 4X" in line:
+            deep_copy = "2X" if "Deep copy 2X" in line else "4X"
+            if (current_case is not None and deep_copies[current_case] is None
+                    and starts[current_case] == len(times)):
+                deep_copies[current_case] = deep_copy
+            else:
+                pending_deep_copy = deep_copy
     
-    return test_cases
+    log = ParsedLog(names=names,
+                    deep_copies=[deep_copy or "Unknown" for deep_copy in deep_copies],
+                    multicasts=multicasts,
+                    times_flat=np.frombuffer(times, dtype=np.float64),
+                    offsets=np.array(starts + [len(times)], dtype=np.int32))
+    
+    # Drop headers that were not followed by any trial; otherwise keep the
+    # zero-copy times_flat view of the parse buffer
+    counts = np.diff(log.offsets)
+    if not counts.all():
+        log = log.select(np.flatnonzero(counts))
+    return log
 
-def calculate_statistics(times):
-    """Calculate mean, std, and other statistics for a list of times."""
-    times_array = np.array(times)
+def calculate_statistics(log):
+    """Calculate mean, std, and other statistics for every test case at once."""
+    # One reduction per statistic across all cases; every case must be non-empty
+    counts = np.diff(log.offsets)
+    starts = log.offsets[:-1]
+    means = np.add.reduceat(log.times_flat, starts) / counts
+    deviations = log.times_flat - np.repeat(means, counts)
     return {
-        'mean': np.mean(times_array),
-        'std': np.std(times_array),
-        'min': np.min(times_array),
-        'max': np.max(times_array),
-        'count': len(times_array)
+        'mean': means,
+        'std': np.sqrt(np.add.reduceat(deviations * deviations, starts) / counts),
+        'min': np.minimum.reduceat(log.times_flat, starts),
+        'max': np.maximum.reduceat(log.times_flat, starts),
+        'count': counts
     }
 
-def create_plot(test_cases):
+@functools.cache
+def _pyplot():
+    """Import pyplot with the Agg backend on first use, so summary-only runs skip it."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+@functools.cache
+def legend_elements():
+    """Legend proxy artists, one per test type, built on first use."""
+    return [_pyplot().Rectangle((0,0),1,1, facecolor=color, alpha=0.7, label=name)
+            for name, color in COLOR_MAP.items()]
+
+def create_plot(log):
     """Create a plot showing average times with error bars."""
-    # Group test cases by name and deep copy factor
-    grouped_cases = defaultdict(list)
-    
-    for case in test_cases:
-        key = f"{case['name']} ({case['deep_copy']})"
-        grouped_cases[key].append(case)
+    # Sort test cases by name and deep copy for consistent ordering
+    log = log.sorted()
     
     # Prepare data for plotting
-    case_names = []
-    means = []
-    stds = []
-    colors = []
-    
-    # Color mapping for different test types
-    color_map = {
-        'TMA No Swizzling': 'blue',
-        'TMA Multicast': 'red', 
-        'TMA No Multicast': 'green'
-    }
-    
-    for key, cases in grouped_cases.items():
-        # Combine all times for this test case
-        all_times = []
-        for case in cases:
-            all_times.extend(case['times'])
-        
-        if all_times:
-            stats = calculate_statistics(all_times)
-            case_names.append(key)
-            means.append(stats['mean'])
-            stds.append(stats['std'])
-            
-            # Determine color based on test type
-            if 'No Swizzling' in key:
-                colors.append(color_map['TMA No Swizzling'])
-            elif 'Multicast' in key and 'NO multicast' not in key:
-                colors.append(color_map['TMA Multicast'])
-            else:
-                colors.append(color_map['TMA No Multicast'])
+    stats = calculate_statistics(log)
+    case_names = log.labels()
+    means = stats['mean']
+    stds = stats['std']
+    colors = [COLOR_MAP[name] for name in log.names]
     
     # Create the plot
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig, ax = _pyplot().subplots(figsize=(14, 8), layout='constrained')
     
     x_pos = np.arange(len(case_names))
     bars = ax.bar(x_pos, means, yerr=stds, capsize=5, color=colors, alpha=0.7, 
@@ -133,54 +201,113 @@ def create_plot(test_cases):
     ax.set_axisbelow(True)
     
     # Create legend
-    legend_elements = [
-        plt.Rectangle((0,0),1,1, facecolor=color_map['TMA No Swizzling'], alpha=0.7, label='TMA No Swizzling'),
-        plt.Rectangle((0,0),1,1, facecolor=color_map['TMA Multicast'], alpha=0.7, label='TMA Multicast'),
-        plt.Rectangle((0,0),1,1, facecolor=color_map['TMA No Multicast'], alpha=0.7, label='TMA No Multicast')
-    ]
-    ax.legend(handles=legend_elements, loc='upper right')
-    
-    plt.tight_layout()
+    ax.legend(handles=legend_elements(), loc='upper right')
+    
     return fig
 
-def print_summary(test_cases):
+def save_figure(fig, output_file, svg_file):
+    """Save the figure as PNG and SVG, laying it out and measuring it only once."""
+    # Run the constrained layout once, then freeze it for both saves
+    fig.canvas.draw()
+    fig.set_layout_engine('none')
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
+    
+    # Render in memory and write each file with a single call
+    for filename, dpi in ((output_file, 300), (svg_file, 'figure')):
+        buf = io.BytesIO()
+        fig.savefig(buf, format=Path(filename).suffix[1:], dpi=dpi, bbox_inches=bbox)
+        Path(filename).write_bytes(buf.getbuffer())
+
+def merge_logs(logs):
+    """Pool the trial times of identical test cases within and across parsed logs."""
+    pooled = {}
+    for log in logs:
+        for i, key in enumerate(zip(log.names, log.deep_copies)):
+            if key not in pooled:
+                pooled[key] = (log.multicasts[i], [])
+            pooled[key][1].append(log.case_times(i))
+    
+    return ParsedLog.from_cases(names=[name for name, _ in pooled],
+                                deep_copies=[deep_copy for _, deep_copy in pooled],
+                                multicasts=[multicast for multicast, _ in pooled.values()],
+                                times_per_case=[np.concatenate(chunks) for _, chunks in pooled.values()])
+
+def print_summary(log):
     """Print a summary of the performance data."""
     print("Performance Analysis Summary")
     print("=" * 50)
     
-    for case in test_cases:
-        if case['times']:
-            stats = calculate_statistics(case['times'])
-            print(f"\n{case['name']} ({case['deep_copy']})")
-            print(f"  Mean: {stats['mean']:.3f} ms")
-            print(f"  Std:  {stats['std']:.3f} ms")
-            print(f"  Min:  {stats['min']:.3f} ms")
-            print(f"  Max:  {stats['max']:.3f} ms")
-            print(f"  Trials: {stats['count']}")
+    # Sort for consistent output
+    log = log.sorted()
+    stats = calculate_statistics(log)
+    
+    for i, label in enumerate(log.labels()):
+        print(f"\n{label}")
+        print(f"  Mean: {stats['mean'][i]:.3f} ms")
+        print(f"  Std:  {stats['std'][i]:.3f} ms")
+        print(f"  Min:  {stats['min'][i]:.3f} ms")
+        print(f"  Max:  {stats['max'][i]:.3f} ms")
+        print(f"  Trials: {stats['count'][i]}")
+
+DEFAULT_INPUT = '/mnt/myspace/cdb/cfx-article-src/tma/out.txt'
+DEFAULT_OUTPUT = '/mnt/myspace/cdb/cfx-article-src/performance_analysis'
+
+def expand_inputs(patterns):
+    """Expand glob patterns into log filenames, keeping each file only once."""
+    # Keyed on the resolved path so 'out.txt out.txt' or overlapping globs are not pooled twice
+    filenames = {}
+    for pattern in patterns:
+        for name in sorted(glob.glob(pattern)) or [pattern]:
+            filenames.setdefault(os.path.realpath(name), name)
+    return list(filenames.values())
+
+def parse_args():
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('inputs', nargs='*', default=[DEFAULT_INPUT],
+                        help='output logs or glob patterns of the tma benchmark; trials of '
+                             'the same test case are pooled (default: %(default)s)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT,
+                        help='path prefix for the .png and .svg plots (default: %(default)s)')
+    parser.add_argument('--exclude', action='append', default=[],
+                        choices=list(COLOR_MAP),
+                        help='test case to leave out of the plot; may be repeated')
+    parser.add_argument('--no-plot', action='store_true',
+                        help='only print the summary, without importing matplotlib')
+    return parser.parse_args()
 
 def main():
     """Main function to parse data and create plots."""
-    filename = '/mnt/myspace/cdb/cfx-article-src/tma/out.txt'
+    args = parse_args()
     
-    # Parse the data
-    test_cases = parse_performance_data(filename)
+    # Parse the data, one process per log when there are several
+    filenames = expand_inputs(args.inputs)
+    if len(filenames) == 1:
+        logs = [parse_performance_data(filenames[0])]
+    else:
+        with ProcessPoolExecutor() as executor:
+            logs = list(executor.map(parse_performance_data, filenames))
+    
+    # Pool repeated test cases, whether they come from one log or several
+    log = merge_logs(logs)
     
     # Print summary
-    print_summary(test_cases)
+    print_summary(log)
+    
+    if args.no_plot:
+        return
     
     # Create and save the plot
-    fig = create_plot(test_cases)
-    output_file = '/mnt/myspace/cdb/cfx-article-src/performance_analysis.png'
-    fig.savefig(output_file, dpi=300, bbox_inches='tight')
+    fig = create_plot(log.select(i for i, name in enumerate(log.names) if name not in args.exclude))
+    output_file = f'{args.output}.png'
+    # Also save as SVG for a vector version
+    svg_file = f'{args.output}.svg'
+    save_figure(fig, output_file, svg_file)
     print(f"\nPlot saved to: {output_file}")
+    print(f"SVG saved to: {svg_file}")
     
-    # Also save as PDF for better quality
-    pdf_file = '/mnt/myspace/cdb/cfx-article-src/performance_analysis.pdf'
-    fig.savefig(pdf_file, bbox_inches='tight')
-    print(f"PDF saved to: {pdf_file}")
-    
-    plt.show()
+    # Batch run: release the figure instead of showing it
+    _pyplot().close(fig)
 
 if __name__ == "__main__":
     main()
-
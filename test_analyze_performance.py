@@ -0,0 +1,73 @@
+import numpy as np
+
+from analyze_performance import (ParsedLog, calculate_statistics, expand_inputs, merge_logs,
+                                 parse_performance_data)
+
+LOG = """\
+Copy with TMA load and store -- no swizzling <<M, N>>: 16384, 16384.
+Trial 0 Completed in 1.5ms (100 GB/s)
+Trial 1 Completed in 1.7ms (100 GB/s)
+Success 2, Fail 0
+Deep copy 2X.
+Copy with TMA Multicast load and store.
+Trial 0 Completed in 2.5ms (100 GB/s)
+Trial 1 Completed in NaNms (100 GB/s)
+Trial 2 Completed in
+"""
+
+def write_log(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+def test_parse_skips_malformed_trials(tmp_path):
+    log = parse_performance_data(write_log(tmp_path, 'out.txt', LOG))
+    assert log.labels() == ['TMA No Swizzling (1X)', 'TMA Multicast (2X)']
+    assert log.case_times(0).tolist() == [1.5, 1.7]
+    assert log.case_times(1).tolist() == [2.5]
+
+def test_parse_deep_copy_after_header(tmp_path):
+    log = parse_performance_data(write_log(tmp_path, 'out.txt', """\
+Copy with TMA Multicast load and store.
+Deep copy 4X.
+Trial 0 Completed in 3.5ms (100 GB/s)
+Success 1, Fail 0
+Deep copy 2X.
+Copy with TMA load and store, NO multicast.
+Trial 0 Completed in 4.5ms (100 GB/s)
+Copy with TMA Multicast load and store.
+"""))
+    assert log.labels() == ['TMA Multicast (4X)', 'TMA No Multicast (2X)']
+    assert log.offsets.tolist() == [0, 1, 2]
+
+def test_merge_logs_pools_repeated_cases(tmp_path):
+    first = parse_performance_data(write_log(tmp_path, 'a.txt', LOG))
+    second = parse_performance_data(write_log(tmp_path, 'b.txt', LOG + LOG))
+    merged = merge_logs([first, second])
+    assert merged.labels() == ['TMA No Swizzling (1X)', 'TMA Multicast (2X)']
+    assert merged.multicasts == [False, True]
+    assert merged.offsets.tolist() == [0, 6, 9]
+    assert merged.case_times(1).tolist() == [2.5, 2.5, 2.5]
+
+def test_expand_inputs_drops_repeated_files(tmp_path):
+    first = write_log(tmp_path, 'a.txt', LOG)
+    second = write_log(tmp_path, 'b.txt', LOG)
+    filenames = expand_inputs([first, str(tmp_path / '*.txt'), str(tmp_path / '.' / 'a.txt')])
+    assert filenames == [first, second]
+
+def test_select_nothing(tmp_path):
+    log = parse_performance_data(write_log(tmp_path, 'out.txt', LOG)).select([])
+    assert len(log) == 0
+    assert log.times_flat.size == 0
+    assert log.offsets.tolist() == [0]
+
+def test_calculate_statistics_matches_numpy():
+    rng = np.random.default_rng(0)
+    times_per_case = [rng.random(n) for n in (1, 10, 257)]
+    log = ParsedLog.from_cases(['TMA Multicast'] * 3, ['2X', '4X', '1X'], [True] * 3, times_per_case)
+    stats = calculate_statistics(log)
+    assert stats['count'].tolist() == [1, 10, 257]
+    assert np.allclose(stats['mean'], [np.mean(times) for times in times_per_case])
+    assert np.allclose(stats['std'], [np.std(times) for times in times_per_case])
+    assert stats['min'].tolist() == [times.min() for times in times_per_case]
+    assert stats['max'].tolist() == [times.max() for times in times_per_case]